@@ -0,0 +1,141 @@
+"""Drive ``GithubClientManager`` against the local stub at rising concurrency.
+
+Every payload goes through the real client, scheduler and proxy handling; the
+stub acts as both the proxy and the origin, so github.com URLs are rewritten
+to plain http ones that the stub answers in absolute form.
+
+Example::
+
+    python -m benchmarks.load_test --levels 1,4,16 --payloads 64 \\
+        --latency lognormal:0.05,0.5 --rate-429 0.02 --reset-rate 0.01
+"""
+import argparse
+import asyncio
+import json
+import time
+
+from collections import Counter
+from typing import List, Optional
+
+from src.enums import SearchType
+from src.managers import GithubClientManager
+from tests.load_report import LevelReport
+from tests.stub_server import (
+    GithubStubServer,
+    StubGithubClient,
+    add_fault_arguments,
+    config_from_args,
+)
+
+
+async def run_level(
+    manager: GithubClientManager,
+    server: GithubStubServer,
+    concurrency: int,
+    payloads: int,
+    json_payload: str,
+    batch: bool,
+) -> LevelReport:
+    report = LevelReport(concurrency=concurrency)
+    remaining = iter(range(payloads))
+    requests_before = server.stats["requests"]
+    statuses_before = Counter(server.stats)
+
+    async def worker():
+        for _ in remaining:
+            started_at = time.perf_counter()
+            try:
+                await manager.get_search_results_response(json_payload, batch=batch)
+            except Exception as exc:
+                report.errors[type(exc).__name__] += 1
+            else:
+                report.latencies.append(time.perf_counter() - started_at)
+
+    started_at = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    report.elapsed = time.perf_counter() - started_at
+    report.server_requests = server.stats["requests"] - requests_before
+    report.server_statuses = Counter(server.stats) - statuses_before
+    return report
+
+
+def format_report(report: LevelReport) -> str:
+    errors = ", ".join(f"{name}={count}" for name, count in report.errors.items())
+    faults = ", ".join(
+        f"{name}={count}"
+        for name, count in sorted(report.server_statuses.items(), key=str)
+        if name not in ("requests", "connections", 200)
+    )
+    return (
+        f"{report.concurrency:>5} {report.succeeded:>5} "
+        f"{sum(report.errors.values()):>5} {report.throughput:>9.2f} "
+        f"{report.requests_per_second:>8.1f} "
+        f"{report.percentile(50) * 1000:>8.1f} {report.percentile(95) * 1000:>8.1f} "
+        f"{report.percentile(99) * 1000:>8.1f}  {errors or '-'} | {faults or '-'}"
+    )
+
+
+async def run_load_test(args: argparse.Namespace, server: GithubStubServer):
+    client = StubGithubClient(server.url, concurrency=args.client_concurrency)
+    manager = GithubClientManager(github_client=client)
+    json_payload = json.dumps(
+        {
+            "keywords": args.keywords.split(","),
+            "proxies": [server.address],
+            "type": args.type,
+        }
+    )
+
+    print(
+        f"{'conc':>5} {'ok':>5} {'err':>5} {'payload/s':>9} {'req/s':>8} "
+        f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}  client errors | server faults"
+    )
+    async with client:
+        for concurrency in args.levels:
+            report = await run_level(
+                manager, server, concurrency, args.payloads, json_payload, args.batch
+            )
+            print(format_report(report))
+
+    for priority, stats in client.scheduler.stats().items():
+        print(
+            f"{priority.name}: dispatched={stats.dispatched} "
+            f"max_depth={stats.max_queue_depth} "
+            f"avg_wait={stats.avg_wait_time * 1000:.1f}ms "
+            f"max_wait={stats.max_wait_time * 1000:.1f}ms"
+        )
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="GitHub crawler load test")
+    parser.add_argument(
+        "--levels",
+        type=lambda value: [int(level) for level in value.split(",")],
+        default=[1, 2, 4, 8, 16, 32],
+        help="comma separated payload concurrency levels",
+    )
+    parser.add_argument("--payloads", type=int, default=32, help="payloads per level")
+    parser.add_argument("--keywords", default="python,django")
+    parser.add_argument(
+        "--type",
+        default=str(SearchType.REPOSITORIES),
+        choices=list(map(str, SearchType)),
+    )
+    parser.add_argument("--client-concurrency", type=int, default=2)
+    parser.add_argument("--batch", action="store_true")
+    add_fault_arguments(parser)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None):
+    args = build_arg_parser().parse_args(argv)
+    server = GithubStubServer(config_from_args(args))
+    server.start_in_thread()
+    try:
+        asyncio.run(run_load_test(args, server))
+    finally:
+        server.stop_thread()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Compare page parsing throughput of the precompiled parser with the old path.
+
+The baseline reproduces the previous extraction: ``lxml.html.fromstring`` and
+string XPath expressions compiled on every ``.xpath()`` call.
+
+Example::
+
+    python -m benchmarks.parsing_benchmark --repeat 5 --number 50
+"""
+import argparse
+import timeit
+
+from typing import Callable, Dict, List, Optional
+
+from lxml import html
+
+from src.parsing import (
+    DETAILED_INFO_LANGUAGES_CONTAINER_XPATH,
+    LANGUAGE_STATS_XPATH,
+    RESULTS_ITEM_CONTAINER_XPATH,
+    RESULTS_ITEM_HREF_XPATH,
+    extract_language_stats,
+    extract_result_paths,
+    parse_html,
+)
+from tests.constants import MOCKED_RESPONSES_PATH
+
+
+def baseline_result_paths(page: str) -> List[str]:
+    tree = html.fromstring(page)
+    return [
+        item.xpath(RESULTS_ITEM_HREF_XPATH)[0]
+        for item in tree.xpath(RESULTS_ITEM_CONTAINER_XPATH)
+    ]
+
+
+def baseline_language_stats(page: str) -> Dict[str, float]:
+    tree = html.fromstring(page)
+    languages_stats = {}
+    for language_element in tree.xpath(DETAILED_INFO_LANGUAGES_CONTAINER_XPATH):
+        language, percent = language_element.xpath(LANGUAGE_STATS_XPATH)
+        languages_stats[language] = float(percent.replace("%", ""))
+    return languages_stats
+
+
+def precompiled_result_paths(page: str) -> List[str]:
+    return extract_result_paths(parse_html(page))
+
+
+def precompiled_language_stats(page: str) -> Dict[str, float]:
+    return extract_language_stats(parse_html(page))
+
+
+def load_pages(pattern: str) -> List[str]:
+    return [path.read_text() for path in sorted(MOCKED_RESPONSES_PATH.glob(pattern))]
+
+
+def measure(extract: Callable, pages: List[str], repeat: int, number: int) -> float:
+    def run():
+        for page in pages:
+            extract(page)
+
+    best = min(timeit.repeat(run, repeat=repeat, number=number))
+    return len(pages) * number / best
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Page parsing micro-benchmark")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--number", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    cases = [
+        (
+            "search pages",
+            load_pages("search/*.html"),
+            baseline_result_paths,
+            precompiled_result_paths,
+        ),
+        (
+            "repo pages",
+            load_pages("repo_detailed_info/*.html"),
+            baseline_language_stats,
+            precompiled_language_stats,
+        ),
+    ]
+    print(f"{'case':<14} {'before pages/s':>15} {'after pages/s':>15} {'speedup':>8}")
+    for name, pages, baseline, precompiled in cases:
+        assert [baseline(page) for page in pages] == [
+            precompiled(page) for page in pages
+        ]
+        before = measure(baseline, pages, args.repeat, args.number)
+        after = measure(precompiled, pages, args.repeat, args.number)
+        print(f"{name:<14} {before:>15.1f} {after:>15.1f} {after / before:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
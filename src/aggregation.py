@@ -0,0 +1,168 @@
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.models import SearchResult
+
+
+UNKNOWN_KEYWORD = ""
+
+
+def _intern(values: Sequence[str]) -> Tuple[np.ndarray, List[str]]:
+    vocabulary: Dict[str, int] = {}
+    codes = [vocabulary.setdefault(value, len(vocabulary)) for value in values]
+    return np.asarray(codes, dtype=np.intp), list(vocabulary)
+
+
+class LanguageStatsTable:
+    """Columnar repo x language table of ``language_stats`` percentages.
+
+    Rows are unique repositories, columns follow the interned ``languages``
+    vocabulary and owners are stored as integer codes per row. A repository
+    found by several keywords is stored once; ``keyword_rows`` and
+    ``keyword_codes`` list every (row, keyword) pair, so only the per-keyword
+    view counts it once for each keyword.
+    """
+
+    def __init__(
+        self,
+        urls: List[str],
+        matrix: np.ndarray,
+        languages: List[str],
+        owner_codes: np.ndarray,
+        owners: List[str],
+        keyword_rows: np.ndarray,
+        keyword_codes: np.ndarray,
+        keywords: List[str],
+    ):
+        self.urls = urls
+        self.matrix = matrix
+        self.languages = languages
+        self.owner_codes = owner_codes
+        self.owners = owners
+        self.keyword_rows = keyword_rows
+        self.keyword_codes = keyword_codes
+        self.keywords = keywords
+
+    @classmethod
+    def from_results(cls, results: Iterable[SearchResult]) -> "LanguageStatsTable":
+        urls: Dict[str, int] = {}
+        owners = []
+        rows, columns, values = [], [], []
+        keyword_pairs: Dict[Tuple[int, str], None] = {}
+        languages: Dict[str, int] = {}
+        for result in results:
+            if result.extra is None:
+                continue
+            row = urls.get(result.url)
+            if row is None:
+                row = urls[result.url] = len(urls)
+                owners.append(result.extra.owner)
+                for language, percent in result.extra.language_stats.items():
+                    rows.append(row)
+                    columns.append(languages.setdefault(language, len(languages)))
+                    values.append(percent)
+            keyword_pairs[(row, result.keyword or UNKNOWN_KEYWORD)] = None
+
+        matrix = np.zeros((len(urls), len(languages)), dtype=np.float32)
+        matrix[rows, columns] = np.asarray(values, dtype=np.float32)
+        owner_codes, owners_vocabulary = _intern(owners)
+        keyword_rows = np.asarray([row for row, _ in keyword_pairs], dtype=np.intp)
+        keyword_codes, keywords_vocabulary = _intern(
+            [keyword for _, keyword in keyword_pairs]
+        )
+        return cls(
+            urls=list(urls),
+            matrix=matrix,
+            languages=list(languages),
+            owner_codes=owner_codes,
+            owners=owners_vocabulary,
+            keyword_rows=keyword_rows,
+            keyword_codes=keyword_codes,
+            keywords=keywords_vocabulary,
+        )
+
+    def __len__(self):
+        return len(self.urls)
+
+    def weighted_totals(self, weights: Optional[np.ndarray] = None) -> np.ndarray:
+        if weights is None:
+            return self.matrix.sum(axis=0, dtype=np.float64)
+        weights = np.asarray(weights, dtype=np.float64)
+        return weights @ self.matrix
+
+    def shares(self, weights: Optional[np.ndarray] = None) -> np.ndarray:
+        return self._normalize(self.weighted_totals(weights))
+
+    def grouped_shares(
+        self,
+        codes: np.ndarray,
+        groups_count: int,
+        rows: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        totals = np.zeros((groups_count, len(self.languages)), dtype=np.float64)
+        if not len(codes):
+            return totals
+        # sort rows by group once and sum contiguous runs, np.add.at is far slower
+        order = np.argsort(codes, kind="stable")
+        sorted_codes = codes[order]
+        sorted_rows = order if rows is None else rows[order]
+        starts = np.flatnonzero(np.diff(sorted_codes, prepend=-1))
+        totals[sorted_codes[starts]] = np.add.reduceat(
+            self.matrix[sorted_rows], starts, axis=0, dtype=np.float64
+        )
+        return self._normalize(totals)
+
+    def keyword_shares(self) -> np.ndarray:
+        return self.grouped_shares(
+            self.keyword_codes, len(self.keywords), rows=self.keyword_rows
+        )
+
+    def owner_shares(self) -> np.ndarray:
+        return self.grouped_shares(self.owner_codes, len(self.owners))
+
+    def top_k(self, shares: np.ndarray, k: int) -> List[Tuple[str, float]]:
+        # languages a group never used are not part of its ranking
+        used_indices = np.flatnonzero(shares > 0)
+        k = min(k, len(used_indices))
+        if k <= 0:
+            return []
+        used_shares = shares[used_indices]
+        top_positions = np.argpartition(-used_shares, k - 1)[:k]
+        top_positions = top_positions[
+            np.argsort(-used_shares[top_positions], kind="stable")
+        ]
+        top_indices = used_indices[top_positions]
+        return [(self.languages[index], float(shares[index])) for index in top_indices]
+
+    def summary(self, top_k: int = 5) -> dict:
+        keyword_shares = self.keyword_shares()
+        owner_shares = self.owner_shares()
+        return {
+            "repositories": len(self),
+            "languages": len(self.languages),
+            "totals": self._to_language_dict(self.weighted_totals()),
+            "top_languages": self._top_k_dict(self.shares(), top_k),
+            "by_keyword": {
+                keyword: self._top_k_dict(keyword_shares[index], top_k)
+                for index, keyword in enumerate(self.keywords)
+            },
+            "by_owner": {
+                owner: self._top_k_dict(owner_shares[index], top_k)
+                for index, owner in enumerate(self.owners)
+            },
+        }
+
+    def _top_k_dict(self, shares: np.ndarray, k: int) -> Dict[str, float]:
+        return {language: round(share, 2) for language, share in self.top_k(shares, k)}
+
+    def _to_language_dict(self, values: np.ndarray) -> Dict[str, float]:
+        return {
+            language: round(float(value), 2)
+            for language, value in zip(self.languages, values)
+        }
+
+    @staticmethod
+    def _normalize(totals: np.ndarray) -> np.ndarray:
+        sums = totals.sum(axis=-1, keepdims=True)
+        return np.divide(totals * 100, sums, out=np.zeros_like(totals), where=sums > 0)
@@ -1,9 +1,15 @@
 import asyncio
+import ipaddress
+import socket
+
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional
 
 import backoff
 import httpx
 
 from src.constants import BASE_URL
+from src.scheduler import RequestScheduler, get_current_flow, get_request_priority
 
 
 DEFAULT_TIMEOUT = 5
@@ -18,15 +24,48 @@ DEFAULT_HEADERS = {
 }
 
 
+@dataclass
+class ProxyWarmupResult:
+    proxy: str
+    opened_connections: int = 0
+    errors: List[str] = field(default_factory=list)
+
+    @property
+    def is_alive(self) -> bool:
+        return self.opened_connections > 0
+
+
 class GithubClient:
 
-    def __init__(self, concurrency: int = 2):
-        self.semaphore = asyncio.Semaphore(concurrency)
+    def __init__(
+        self,
+        concurrency: int = 2,
+        scheduler: Optional[RequestScheduler] = None,
+    ):
+        self.scheduler = scheduler or RequestScheduler(concurrency)
+        self._http_clients: Dict[str, httpx.AsyncClient] = {}
+        self._resolved_proxies: Dict[str, str] = {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def aclose(self):
+        http_clients = list(self._http_clients.values())
+        self._http_clients.clear()
+        for http_client in http_clients:
+            await http_client.aclose()
 
     @staticmethod
     def get_search_endpoint():
         return f"{BASE_URL}/search"
 
+    @staticmethod
+    def get_warmup_url():
+        return BASE_URL
+
     @staticmethod
     def get_prepared_proxies_param(proxy: str):
         if not proxy.startswith("http"):
@@ -34,6 +73,33 @@ class GithubClient:
         proxies = {"http://": proxy, "https://": proxy}
         return proxies
 
+    async def resolve_proxy(self, proxy: str) -> str:
+        if proxy in self._resolved_proxies:
+            return self._resolved_proxies[proxy]
+
+        proxy_url = httpx.URL(self.get_prepared_proxies_param(proxy)["http://"])
+        resolved = str(proxy_url)
+        # https proxies keep their hostname, it is needed for TLS verification
+        if proxy_url.scheme == "http" and not self._is_ip_address(proxy_url.host):
+            addresses = await asyncio.get_running_loop().getaddrinfo(
+                proxy_url.host, proxy_url.port or 80, type=socket.SOCK_STREAM
+            )
+            # prefer IPv4, many proxies only listen on it even when AAAA exists
+            addresses.sort(key=lambda address: address[0] != socket.AF_INET)
+            resolved = str(proxy_url.copy_with(host=addresses[0][4][0]))
+
+        self._resolved_proxies[proxy] = resolved
+        return resolved
+
+    async def warm_up(
+        self, proxies: Iterable[str], connections: int = 1
+    ) -> Dict[str, ProxyWarmupResult]:
+        proxies = list(dict.fromkeys(proxies))
+        results = await asyncio.gather(
+            *(self._warm_up_proxy(proxy, connections) for proxy in proxies)
+        )
+        return dict(zip(proxies, results))
+
     async def get_search_results_page(
         self,
         query: str,
@@ -47,6 +113,7 @@ class GithubClient:
             full_url=endpoint,
             params=params,
             proxy=proxy,
+            priority=get_request_priority(is_search=True),
         )
         return response.text
 
@@ -59,6 +126,7 @@ class GithubClient:
             "GET",
             full_url=repo_url,
             proxy=proxy,
+            priority=get_request_priority(is_search=False),
         )
         return response.text
 
@@ -68,16 +136,62 @@ class GithubClient:
         method: str,
         full_url: str,
         proxy: str,
+        priority: int,
         **kwargs,
     ):
-        async with self.semaphore:
-            proxies = self.get_prepared_proxies_param(proxy)
-            async with httpx.AsyncClient(
-                headers=DEFAULT_HEADERS,
-                proxies=proxies,
-            ) as client:
-                response = await client.request(
-                    method, full_url, timeout=DEFAULT_TIMEOUT, **kwargs
+        async with self.scheduler.slot(priority, flow=get_current_flow()):
+            client = self._get_http_client(proxy)
+            response = await client.request(
+                method, full_url, timeout=DEFAULT_TIMEOUT, **kwargs
+            )
+            response.raise_for_status()
+            return response
+
+    async def _warm_up_proxy(self, proxy: str, connections: int) -> ProxyWarmupResult:
+        result = ProxyWarmupResult(proxy=proxy)
+        try:
+            await self.resolve_proxy(proxy)
+        except OSError as exc:
+            result.errors.append(f"{type(exc).__name__}: {exc}")
+            return result
+
+        # concurrent requests force the pool to open one connection each,
+        # they stay keep-alive for the crawl that follows
+        client = self._get_http_client(proxy)
+        responses = await asyncio.gather(
+            *(
+                client.head(self.get_warmup_url(), timeout=DEFAULT_TIMEOUT)
+                for _ in range(connections)
+            ),
+            return_exceptions=True,
+        )
+        for response in responses:
+            if isinstance(response, httpx.RequestError):
+                result.errors.append(f"{type(response).__name__}: {response}")
+            elif isinstance(response, BaseException):
+                raise response
+            elif response.is_error:
+                # e.g. 407/403 from a proxy rejecting us or a 5xx gateway error
+                result.errors.append(
+                    f"HTTP {response.status_code}: {response.reason_phrase}"
                 )
-                response.raise_for_status()
-                return response
+            else:
+                result.opened_connections += 1
+        return result
+
+    def _get_http_client(self, proxy: str) -> httpx.AsyncClient:
+        if proxy not in self._http_clients:
+            resolved_proxy = self._resolved_proxies.get(proxy, proxy)
+            self._http_clients[proxy] = httpx.AsyncClient(
+                headers=DEFAULT_HEADERS,
+                proxies=self.get_prepared_proxies_param(resolved_proxy),
+            )
+        return self._http_clients[proxy]
+
+    @staticmethod
+    def _is_ip_address(host: str) -> bool:
+        try:
+            ipaddress.ip_address(host)
+        except ValueError:
+            return False
+        return True
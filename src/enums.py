@@ -1,4 +1,4 @@
-from enum import Enum
+from enum import Enum, IntEnum
 
 
 class SearchType(str, Enum):
@@ -8,3 +8,10 @@ class SearchType(str, Enum):
 
     def __str__(self):
         return self.value
+
+
+class RequestPriority(IntEnum):
+    INTERACTIVE_SEARCH = 0
+    INTERACTIVE_DETAIL = 1
+    BATCH_SEARCH = 2
+    BATCH_DETAIL = 3
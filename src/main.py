@@ -1,14 +1,22 @@
+from src.aggregation import LanguageStatsTable
 from src.managers import GithubClientManager
 from src.managers.args_parse_manager import ArgsParseManager
+from src.models import dump_search_results_json
 
 import asyncio
+import json
 
 
 async def main():
     args = ArgsParseManager().parse_args()
-    github_client_manager = GithubClientManager()
-    results = await github_client_manager.get_search_results_response(args.json_payload)
-    print(results)
+    async with GithubClientManager() as github_client_manager:
+        results = await github_client_manager.get_search_results(args.json_payload)
+    results_json = dump_search_results_json(results)
+    if args.summary:
+        summary = LanguageStatsTable.from_results(results).summary(top_k=args.top_k)
+        summary_json = json.dumps(summary)
+        results_json = f'{{"results": {results_json}, "summary": {summary_json}}}'
+    print(results_json)
 
 
 if __name__ == "__main__":
@@ -8,6 +8,14 @@ class ArgsParseManager:
     def parser(self):
         parser = argparse.ArgumentParser()
         parser.add_argument("-json_payload", type=str, help="json payload")
+        parser.add_argument(
+            "-summary",
+            action="store_true",
+            help="output results together with a language statistics summary",
+        )
+        parser.add_argument(
+            "-top_k", type=int, default=5, help="languages per summary group"
+        )
         return parser
 
     def parse_args(self, *args):
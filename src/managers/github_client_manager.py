@@ -1,49 +1,83 @@
 import asyncio
+import logging
 import random
 
 from typing import Optional, List
 from urllib.parse import urljoin
-from lxml import html
 
 from src.client import GithubClient
 from src.models import (
     SearchRequestParams,
+    SearchResult,
     SearchResultResponse,
-    DetailedRepoInfoResponse,
+    DetailedRepoInfo,
 )
 from src.constants import BASE_URL
 from src.enums import SearchType
+from src.parsing import parse_html, extract_result_paths, extract_language_stats
+from src.scheduler import request_flow
 
 
-RESULTS_LIST_XPATH = '//div[@data-testid="results-list"]'
-RESULTS_ITEM_CONTAINER_XPATH = (
-    f'{RESULTS_LIST_XPATH}//div[contains(@class, "search-title")]'
-)
-DETAILED_INFO_LANGUAGES_CONTAINER_XPATH = (
-    f"//div[@class='Layout-sidebar']//div[(./h2/text()='Languages')]/ul/li/a"
-)
+logger = logging.getLogger(__name__)
 
 
 class InvalidHtmlError(Exception):
     pass
 
 
+class NoAliveProxiesError(Exception):
+    pass
+
+
 class GithubClientManager:
 
     def __init__(self, github_client: Optional[GithubClient] = None):
+        self._owns_github_client = github_client is None
         self.github_client = github_client or GithubClient()
 
-    async def get_search_results_response(self, json_payload: str):
-        request_params = SearchRequestParams.model_validate_json(json_payload)
-        random_proxy = self._get_random_proxy(request_params.proxies)
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
 
-        items_collection = await self._fill_with_base_info(request_params, random_proxy)
-        if request_params.type == SearchType.REPOSITORIES:
-            await self._extend_repos_with_detailed_info(items_collection, random_proxy)
+    async def aclose(self):
+        # a client passed in by the caller is closed by the caller
+        if self._owns_github_client:
+            await self.github_client.aclose()
+
+    async def get_search_results_response(
+        self, json_payload: str, batch: bool = False, validate: bool = False
+    ):
+        items_collection = await self.get_search_results(json_payload, batch=batch)
+        if validate:
+            return [
+                SearchResultResponse.model_validate(item.to_dict()).model_dump(
+                    exclude_unset=True
+                )
+                for item in items_collection
+            ]
+        return [item.to_dict() for item in items_collection]
+
+    async def get_search_results(
+        self, json_payload: str, batch: bool = False
+    ) -> List[SearchResult]:
+        request_params = SearchRequestParams.model_validate_json(json_payload)
+        proxies = request_params.proxies
+        if request_params.warmup_connections:
+            proxies = await self._warm_up_proxies(
+                proxies, request_params.warmup_connections
+            )
+        random_proxy = self._get_random_proxy(proxies)
 
-        items_collection = [
-            item.model_dump(exclude_unset=True) for item in items_collection
-        ]
+        with request_flow(batch=batch):
+            items_collection = await self._fill_with_base_info(
+                request_params, random_proxy
+            )
+            if request_params.type == SearchType.REPOSITORIES:
+                await self._extend_repos_with_detailed_info(
+                    items_collection, random_proxy
+                )
         return items_collection
 
     async def _fill_with_base_info(
@@ -60,24 +94,24 @@ class GithubClientManager:
             )
             tasks.append(result_page_content_coro)
 
-        results = await asyncio.gather(*tasks)
+        results = await self._gather_or_cancel(tasks)
         items_collection = []
-        for result_page_content in results:
+        for keyword, result_page_content in zip(request_params.keywords, results):
             response_tree = self._parse_response_text(result_page_content)
-            items_tree = response_tree.xpath(RESULTS_ITEM_CONTAINER_XPATH)
-            if not items_tree:
+            items_paths = extract_result_paths(response_tree)
+            if not items_paths:
                 raise InvalidHtmlError("Items section not found")
 
-            for item in items_tree:
-                item_path = item.xpath("./a/@href")[0]
+            for item_path in items_paths:
                 item_full_url = urljoin(BASE_URL, item_path)
-                item_response = SearchResultResponse(url=item_full_url)
-                items_collection.append(item_response)
+                items_collection.append(
+                    SearchResult(url=item_full_url, keyword=keyword)
+                )
 
         return items_collection
 
     async def _extend_repos_with_detailed_info(
-        self, items_collection: List[SearchResultResponse], random_proxy: str
+        self, items_collection: List[SearchResult], random_proxy: str
     ):
         urls = [item.url for item in items_collection]
         tasks = []
@@ -88,25 +122,44 @@ class GithubClientManager:
             )
             tasks.append(result_page_coro)
 
-        results = await asyncio.gather(*tasks)
+        results = await self._gather_or_cancel(tasks)
         for index, result_page_content in enumerate(results, 0):
             response_tree = self._parse_response_text(result_page_content)
-            languages = response_tree.xpath(DETAILED_INFO_LANGUAGES_CONTAINER_XPATH)
-
             owner = urls[index].split("/")[-2]
-            languages_stats = {}
-            for language in languages:
-                language, percent = language.xpath("./span/text()")
-                languages_stats[language] = percent.replace("%", "")
+            languages_stats = extract_language_stats(response_tree)
 
-            detailed = DetailedRepoInfoResponse(
-                owner=owner, language_stats=languages_stats
-            )
-            items_collection[index].extra = detailed
+            detailed = DetailedRepoInfo(owner=owner, language_stats=languages_stats)
+            items_collection[index] = items_collection[index]._replace(extra=detailed)
+
+    async def _warm_up_proxies(self, proxies: List[str], connections: int):
+        warmup_results = await self.github_client.warm_up(proxies, connections)
+        alive_proxies = []
+        for proxy, result in warmup_results.items():
+            if result.is_alive:
+                alive_proxies.append(proxy)
+            else:
+                logger.warning("Proxy %s is unreachable: %s", proxy, result.errors)
+
+        if not alive_proxies:
+            raise NoAliveProxiesError(f"All proxies failed warm-up: {proxies}")
+        return alive_proxies
+
+    @staticmethod
+    async def _gather_or_cancel(coros):
+        # plain gather leaves sibling requests running after the first failure,
+        # they would keep holding scheduler slots for the next payloads
+        tasks = [asyncio.ensure_future(coro) for coro in coros]
+        try:
+            return await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
 
     @staticmethod
     def _parse_response_text(response_text: str):
-        return html.fromstring(response_text)
+        return parse_html(response_text)
 
     @staticmethod
     def _get_random_proxy(proxies_list: List[str]):
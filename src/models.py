@@ -1,5 +1,7 @@
-from typing import Optional, Dict
-from pydantic import BaseModel, conlist
+import json
+
+from typing import Optional, Dict, Iterable, NamedTuple
+from pydantic import BaseModel, conint, conlist
 
 from src.enums import SearchType
 
@@ -8,6 +10,7 @@ class SearchRequestParams(BaseModel):
     keywords: conlist(str, min_length=1)
     proxies: conlist(str, min_length=1)
     type: SearchType
+    warmup_connections: conint(ge=0) = 0
 
 
 class DetailedRepoInfoResponse(BaseModel):
@@ -18,3 +21,32 @@ class DetailedRepoInfoResponse(BaseModel):
 class SearchResultResponse(BaseModel):
     url: str
     extra: Optional[DetailedRepoInfoResponse] = None
+
+
+# Internal records for already trusted crawl data. They skip pydantic
+# validation; the response models above check the same shape when
+# ``get_search_results_response`` is asked to validate.
+
+
+class DetailedRepoInfo(NamedTuple):
+    owner: str
+    language_stats: Dict[str, float]
+
+    def to_dict(self):
+        return {"owner": self.owner, "language_stats": self.language_stats}
+
+
+class SearchResult(NamedTuple):
+    url: str
+    extra: Optional[DetailedRepoInfo] = None
+    # search keyword that produced the hit, kept for aggregation only
+    keyword: Optional[str] = None
+
+    def to_dict(self):
+        if self.extra is None:
+            return {"url": self.url}
+        return {"url": self.url, "extra": self.extra.to_dict()}
+
+
+def dump_search_results_json(results: Iterable[SearchResult]) -> str:
+    return json.dumps([result.to_dict() for result in results])
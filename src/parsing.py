@@ -0,0 +1,48 @@
+from typing import Dict, List
+
+from lxml import etree
+
+
+RESULTS_LIST_XPATH = '//div[@data-testid="results-list"]'
+RESULTS_ITEM_CONTAINER_XPATH = (
+    f'{RESULTS_LIST_XPATH}//div[contains(@class, "search-title")]'
+)
+DETAILED_INFO_LANGUAGES_CONTAINER_XPATH = (
+    f"//div[@class='Layout-sidebar']//div[(./h2/text()='Languages')]/ul/li/a"
+)
+RESULTS_ITEM_HREF_XPATH = "./a/@href"
+LANGUAGE_STATS_XPATH = "./span/text()"
+
+find_result_items = etree.XPath(RESULTS_ITEM_CONTAINER_XPATH)
+find_result_item_href = etree.XPath(RESULTS_ITEM_HREF_XPATH, smart_strings=False)
+find_languages = etree.XPath(DETAILED_INFO_LANGUAGES_CONTAINER_XPATH)
+find_language_stats = etree.XPath(LANGUAGE_STATS_XPATH, smart_strings=False)
+
+# Plain etree elements skip the lxml.html class lookup, and comments, blank
+# text and the id index are never queried. Parsers are not thread safe, which
+# is fine as long as parsing stays on the event loop thread.
+HTML_PARSER = etree.HTMLParser(
+    remove_comments=True,
+    remove_blank_text=True,
+    remove_pis=True,
+    collect_ids=False,
+)
+
+
+def parse_html(response_text: str) -> etree._Element:
+    tree = etree.fromstring(response_text, HTML_PARSER)
+    if tree is None:
+        raise etree.ParserError("Document is empty")
+    return tree
+
+
+def extract_result_paths(tree: etree._Element) -> List[str]:
+    return [find_result_item_href(item)[0] for item in find_result_items(tree)]
+
+
+def extract_language_stats(tree: etree._Element) -> Dict[str, float]:
+    languages_stats = {}
+    for language_element in find_languages(tree):
+        language, percent = find_language_stats(language_element)
+        languages_stats[language] = float(percent.replace("%", ""))
+    return languages_stats
@@ -0,0 +1,169 @@
+import asyncio
+import itertools
+import time
+
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Deque, Dict, Hashable, Optional
+
+from src.enums import RequestPriority
+
+
+_current_flow: ContextVar[Optional[Hashable]] = ContextVar("request_flow", default=None)
+_batch_mode: ContextVar[bool] = ContextVar("request_batch_mode", default=False)
+_flow_ids = itertools.count()
+
+
+@contextmanager
+def request_flow(flow: Optional[Hashable] = None, batch: bool = False):
+    """Tag every request issued inside the block with a flow and a priority class.
+
+    Context variables are copied into tasks created by ``asyncio.gather``, so
+    the tag follows all requests spawned for one payload.
+    """
+    if flow is None:
+        flow = next(_flow_ids)
+    flow_token = _current_flow.set(flow)
+    batch_token = _batch_mode.set(batch)
+    try:
+        yield
+    finally:
+        _batch_mode.reset(batch_token)
+        _current_flow.reset(flow_token)
+
+
+def get_current_flow() -> Optional[Hashable]:
+    return _current_flow.get()
+
+
+def get_request_priority(is_search: bool) -> RequestPriority:
+    if _batch_mode.get():
+        if is_search:
+            return RequestPriority.BATCH_SEARCH
+        return RequestPriority.BATCH_DETAIL
+    if is_search:
+        return RequestPriority.INTERACTIVE_SEARCH
+    return RequestPriority.INTERACTIVE_DETAIL
+
+
+@dataclass
+class PriorityStats:
+    queue_depth: int = 0
+    max_queue_depth: int = 0
+    dispatched: int = 0
+    total_wait_time: float = 0.0
+    max_wait_time: float = 0.0
+
+    @property
+    def avg_wait_time(self) -> float:
+        if not self.dispatched:
+            return 0.0
+        return self.total_wait_time / self.dispatched
+
+
+class RequestScheduler:
+    """Concurrency limiter with strict priority classes.
+
+    Waiters of the same priority are served round-robin across flows, so one
+    large payload cannot monopolise a class while others are queued behind it.
+    """
+
+    def __init__(self, concurrency: int = 2):
+        self.concurrency = concurrency
+        self._in_flight = 0
+        self._queues: Dict[int, "OrderedDict[Hashable, Deque[asyncio.Future]]"] = {
+            int(priority): OrderedDict() for priority in RequestPriority
+        }
+        self._stats: Dict[int, PriorityStats] = {
+            int(priority): PriorityStats() for priority in RequestPriority
+        }
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def stats(self) -> Dict[RequestPriority, PriorityStats]:
+        return {
+            RequestPriority(priority): stats for priority, stats in self._stats.items()
+        }
+
+    @asynccontextmanager
+    async def slot(self, priority: int, flow: Optional[Hashable] = None):
+        await self.acquire(priority, flow)
+        try:
+            yield
+        finally:
+            self.release()
+
+    async def acquire(self, priority: int, flow: Optional[Hashable] = None):
+        priority = int(priority)
+        stats = self._stats[priority]
+        if self._in_flight < self.concurrency and not self._has_waiters():
+            self._in_flight += 1
+            stats.dispatched += 1
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._queues[priority].setdefault(flow, deque()).append(waiter)
+        stats.queue_depth += 1
+        stats.max_queue_depth = max(stats.max_queue_depth, stats.queue_depth)
+        started_at = time.perf_counter()
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # the slot was handed over right before cancellation
+                self.release()
+            else:
+                self._discard_waiter(priority, flow, waiter)
+            raise
+
+        waited = time.perf_counter() - started_at
+        stats.total_wait_time += waited
+        stats.max_wait_time = max(stats.max_wait_time, waited)
+
+    def release(self):
+        self._in_flight -= 1
+        self._wake_next()
+
+    def _has_waiters(self) -> bool:
+        return any(self._queues.values())
+
+    def _wake_next(self):
+        while self._in_flight < self.concurrency:
+            waiter = self._pop_next_waiter()
+            if waiter is None:
+                return
+            self._in_flight += 1
+            waiter.set_result(None)
+
+    def _pop_next_waiter(self) -> Optional[asyncio.Future]:
+        for priority in sorted(self._queues):
+            flows = self._queues[priority]
+            while flows:
+                flow, waiters = next(iter(flows.items()))
+                waiter = waiters.popleft()
+                if waiters:
+                    flows.move_to_end(flow)
+                else:
+                    del flows[flow]
+
+                stats = self._stats[priority]
+                stats.queue_depth -= 1
+                if waiter.done():
+                    continue
+                stats.dispatched += 1
+                return waiter
+        return None
+
+    def _discard_waiter(self, priority: int, flow: Optional[Hashable], waiter):
+        flows = self._queues[priority]
+        waiters = flows.get(flow)
+        if waiters is None or waiter not in waiters:
+            return
+        waiters.remove(waiter)
+        if not waiters:
+            del flows[flow]
+        self._stats[priority].queue_depth -= 1
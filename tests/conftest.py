@@ -1,17 +1,15 @@
-import pathlib
-
 import pytest
+import pytest_asyncio
 
 from src.client import GithubClient
+from tests.constants import MOCKED_RESPONSES_PATH
 
 
 @pytest.fixture(scope="session")
 def get_mocked_response():
-    current_path = pathlib.Path(__file__).parent.resolve()
-
     def wrapper(prefix: str, file_name: str):
         with open(
-            f"{current_path}/mocked_responses/{prefix}_{file_name}.html", "r"
+            MOCKED_RESPONSES_PATH / f"{prefix}_{file_name}.html", "r"
         ) as html_file:
             return html_file.read()
 
@@ -62,6 +60,8 @@ def get_wikis_search_response(get_mocked_response):
     return wrapper
 
 
-@pytest.fixture()
-def github_client():
-    return GithubClient()
+@pytest_asyncio.fixture()
+async def github_client():
+    client = GithubClient()
+    yield client
+    await client.aclose()
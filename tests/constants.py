@@ -0,0 +1,4 @@
+import pathlib
+
+
+MOCKED_RESPONSES_PATH = pathlib.Path(__file__).parent.resolve() / "mocked_responses"
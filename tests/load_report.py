@@ -0,0 +1,34 @@
+import math
+
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import List
+
+
+@dataclass
+class LevelReport:
+    concurrency: int
+    latencies: List[float] = field(default_factory=list)
+    errors: Counter = field(default_factory=Counter)
+    elapsed: float = 0.0
+    server_requests: int = 0
+    server_statuses: Counter = field(default_factory=Counter)
+
+    @property
+    def succeeded(self) -> int:
+        return len(self.latencies)
+
+    @property
+    def throughput(self) -> float:
+        return self.succeeded / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def requests_per_second(self) -> float:
+        return self.server_requests / self.elapsed if self.elapsed else 0.0
+
+    def percentile(self, percent: float) -> float:
+        if not self.latencies:
+            return float("nan")
+        ordered = sorted(self.latencies)
+        rank = max(math.ceil(percent / 100 * len(ordered)) - 1, 0)
+        return ordered[min(rank, len(ordered) - 1)]
@@ -0,0 +1,352 @@
+"""Local GitHub stand-in serving the pages from ``tests/mocked_responses``.
+
+The server answers both origin-form (``GET /search?q=...``) and absolute-form
+(``GET http://host/search?q=...``) requests, so it can be used directly or as
+the HTTP proxy the crawler is pointed at. Faults are injected per request
+according to ``StubServerConfig``.
+
+Run standalone with ``python -m tests.stub_server --help``.
+"""
+import argparse
+import asyncio
+import random
+import socket
+import struct
+import threading
+
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Set, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from src.client import GithubClient
+from src.constants import BASE_URL
+from tests.constants import MOCKED_RESPONSES_PATH
+
+
+DEFAULT_SEARCH_KEYWORD = "python"
+REASON_PHRASES = {
+    200: "OK",
+    400: "Bad Request",
+    429: "Too Many Requests",
+    500: "Internal Server Error",
+    502: "Bad Gateway",
+    503: "Service Unavailable",
+}
+
+
+@dataclass
+class LatencyDistribution:
+    kind: str = "constant"
+    params: Tuple[float, ...] = (0.0,)
+
+    @classmethod
+    def parse(cls, spec: str) -> "LatencyDistribution":
+        """Parse ``kind:p1,p2`` specs, e.g. ``uniform:0.01,0.1``.
+
+        Supported kinds: ``constant:seconds``, ``uniform:low,high``,
+        ``exponential:mean`` and ``lognormal:median,sigma``.
+        """
+        kind, _, raw_params = spec.partition(":")
+        params = tuple(float(param) for param in raw_params.split(",") if param)
+        expected_params = {
+            "constant": 1,
+            "uniform": 2,
+            "exponential": 1,
+            "lognormal": 2,
+        }
+        if kind not in expected_params or len(params) != expected_params[kind]:
+            raise ValueError(f"Invalid latency distribution: {spec!r}")
+        return cls(kind=kind, params=params)
+
+    def sample(self, rng: random.Random) -> float:
+        if self.kind == "constant":
+            return self.params[0]
+        if self.kind == "uniform":
+            return rng.uniform(*self.params)
+        if self.kind == "exponential":
+            return rng.expovariate(1 / self.params[0]) if self.params[0] else 0.0
+        median, sigma = self.params
+        return median * rng.lognormvariate(0, sigma)
+
+
+@dataclass
+class StubServerConfig:
+    latency: LatencyDistribution = field(default_factory=LatencyDistribution)
+    rate_429: float = 0.0
+    rate_5xx: float = 0.0
+    retry_after: Optional[int] = 1
+    drip_rate: float = 0.0
+    drip_chunk_size: int = 1024
+    drip_delay: float = 0.01
+    reset_rate: float = 0.0
+    seed: Optional[int] = None
+
+
+class GithubStubServer:
+
+    def __init__(
+        self,
+        config: Optional[StubServerConfig] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        self.config = config or StubServerConfig()
+        self.host = host
+        self.port = port
+        self.stats: Counter = Counter()
+        self._rng = random.Random(self.config.seed)
+        self._pages = self._load_pages()
+        self._detail_pages = sorted(
+            name for name in self._pages if name.startswith("repo_detailed_info/")
+        )
+        self._detail_index = 0
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._handler_tasks: Set[asyncio.Task] = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def address(self) -> str:
+        return f"{self.host}:{self.port}"
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.address}"
+
+    async def start(self):
+        self._server = await asyncio.start_server(
+            self._handle_connection, self.host, self.port
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        if self._server is None:
+            return
+        self._server.close()
+        # handlers of open keep-alive or dripping connections would otherwise
+        # outlive the loop they run on
+        handler_tasks = list(self._handler_tasks)
+        for task in handler_tasks:
+            task.cancel()
+        await asyncio.gather(*handler_tasks, return_exceptions=True)
+        await self._server.wait_closed()
+        self._server = None
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.stop()
+
+    def start_in_thread(self):
+        """Serve from a dedicated event loop so the client loop is not shared."""
+        started = threading.Event()
+        self._loop = asyncio.new_event_loop()
+
+        def run():
+            asyncio.set_event_loop(self._loop)
+            self._loop.run_until_complete(self.start())
+            started.set()
+            self._loop.run_forever()
+
+        self._thread = threading.Thread(target=run, daemon=True)
+        self._thread.start()
+        started.wait()
+
+    def stop_thread(self):
+        if self._loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(self.stop(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+        self._loop = None
+        self._thread = None
+
+    @staticmethod
+    def _load_pages() -> Dict[str, bytes]:
+        pages = {}
+        for path in MOCKED_RESPONSES_PATH.glob("*/*.html"):
+            name = path.relative_to(MOCKED_RESPONSES_PATH).with_suffix("").as_posix()
+            pages[name] = path.read_bytes()
+        return pages
+
+    def _resolve_page(self, target: str) -> Tuple[int, bytes]:
+        url = urlsplit(target)
+        if url.path == "/search":
+            query = parse_qs(url.query)
+            search_type = query.get("type", ["Repositories"])[0].lower()
+            keyword = query.get("q", [DEFAULT_SEARCH_KEYWORD])[0]
+            page = self._pages.get(f"search/{search_type}_search_response_{keyword}")
+            if page is None:
+                page = self._pages.get(
+                    f"search/{search_type}_search_response_{DEFAULT_SEARCH_KEYWORD}"
+                )
+            if page is None:
+                return 400, b""
+            return 200, page
+
+        # every other path is treated as a repository page
+        name = self._detail_pages[self._detail_index % len(self._detail_pages)]
+        self._detail_index += 1
+        return 200, self._pages[name]
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ):
+        task = asyncio.current_task()
+        self._handler_tasks.add(task)
+        self.stats["connections"] += 1
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    return
+                request_line = head.split(b"\r\n", 1)[0].decode("latin-1")
+                method, target, _ = request_line.split(" ", 2)
+                keep_alive = b"connection: close" not in head.lower()
+                self.stats["requests"] += 1
+                if not await self._respond(writer, method, target, keep_alive):
+                    return
+                if not keep_alive:
+                    return
+        except asyncio.CancelledError:
+            # only stop() cancels handlers; returning normally keeps the
+            # streams done-callback from reporting the cancellation as an error
+            return
+        finally:
+            self._handler_tasks.discard(task)
+            if not writer.transport.is_closing():
+                writer.close()
+
+    async def _respond(
+        self,
+        writer: asyncio.StreamWriter,
+        method: str,
+        target: str,
+        keep_alive: bool,
+    ) -> bool:
+        config = self.config
+        await asyncio.sleep(config.latency.sample(self._rng))
+
+        if self._rng.random() < config.reset_rate:
+            self.stats["resets"] += 1
+            self._reset_connection(writer)
+            return False
+
+        headers = {}
+        fault = self._rng.random()
+        if fault < config.rate_429:
+            status, body = 429, b""
+            if config.retry_after is not None:
+                headers["Retry-After"] = str(config.retry_after)
+        elif fault < config.rate_429 + config.rate_5xx:
+            status, body = self._rng.choice((500, 502, 503)), b""
+            if config.retry_after is not None:
+                headers["Retry-After"] = str(config.retry_after)
+        else:
+            status, body = self._resolve_page(target)
+            headers["Content-Type"] = "text/html; charset=utf-8"
+        self.stats[status] += 1
+
+        headers["Content-Length"] = str(len(body))
+        headers["Connection"] = "keep-alive" if keep_alive else "close"
+        head = f"HTTP/1.1 {status} {REASON_PHRASES[status]}\r\n"
+        head += "".join(f"{name}: {value}\r\n" for name, value in headers.items())
+        writer.write(head.encode("latin-1") + b"\r\n")
+        if method == "HEAD":
+            # Content-Length still describes the GET body, none is sent
+            body = b""
+
+        try:
+            if body and self._rng.random() < config.drip_rate:
+                self.stats["drips"] += 1
+                for start in range(0, len(body), config.drip_chunk_size):
+                    writer.write(body[start : start + config.drip_chunk_size])
+                    await writer.drain()
+                    await asyncio.sleep(config.drip_delay)
+            else:
+                writer.write(body)
+            await writer.drain()
+        except ConnectionError:
+            return False
+        return True
+
+    @staticmethod
+    def _reset_connection(writer: asyncio.StreamWriter):
+        sock = writer.get_extra_info("socket")
+        if sock is not None:
+            # zero linger makes close() send RST instead of FIN
+            sock.setsockopt(
+                socket.SOL_SOCKET, socket.SO_LINGER, struct.pack("ii", 1, 0)
+            )
+        writer.transport.abort()
+
+
+class StubGithubClient(GithubClient):
+
+    def __init__(self, stub_url: str, **kwargs):
+        super().__init__(**kwargs)
+        self.stub_url = stub_url
+
+    def get_warmup_url(self):
+        return self.stub_url
+
+    async def _perform_request(self, method: str, full_url: str, proxy: str, **kwargs):
+        if full_url.startswith(BASE_URL):
+            full_url = self.stub_url + full_url[len(BASE_URL) :]
+        return await super()._perform_request(method, full_url, proxy, **kwargs)
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Local GitHub stub server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    add_fault_arguments(parser)
+    return parser
+
+
+def add_fault_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument(
+        "--latency",
+        type=LatencyDistribution.parse,
+        default=LatencyDistribution(),
+        help="constant:S | uniform:LOW,HIGH | exponential:MEAN | lognormal:MEDIAN,SIGMA",
+    )
+    parser.add_argument("--rate-429", type=float, default=0.0)
+    parser.add_argument("--rate-5xx", type=float, default=0.0)
+    parser.add_argument("--retry-after", type=int, default=1)
+    parser.add_argument("--drip-rate", type=float, default=0.0)
+    parser.add_argument("--drip-chunk-size", type=int, default=1024)
+    parser.add_argument("--drip-delay", type=float, default=0.01)
+    parser.add_argument("--reset-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=None)
+
+
+def config_from_args(args: argparse.Namespace) -> StubServerConfig:
+    return StubServerConfig(
+        latency=args.latency,
+        rate_429=args.rate_429,
+        rate_5xx=args.rate_5xx,
+        retry_after=args.retry_after,
+        drip_rate=args.drip_rate,
+        drip_chunk_size=args.drip_chunk_size,
+        drip_delay=args.drip_delay,
+        reset_rate=args.reset_rate,
+        seed=args.seed,
+    )
+
+
+async def serve_forever(server: GithubStubServer):
+    async with server:
+        print(f"Serving GitHub stub on {server.url}")
+        await asyncio.Event().wait()
+
+
+if __name__ == "__main__":
+    args = build_arg_parser().parse_args()
+    stub_server = GithubStubServer(config_from_args(args), args.host, args.port)
+    asyncio.run(serve_forever(stub_server))
@@ -6,3 +6,19 @@ def test_parse_input_arguments():
     json_payload = '{"keywords": ["python", "drf"], "proxies": ["1.1.1.1:8080"], "type": "Repositories"}'
     parsed = manager.parse_args(["-json_payload", json_payload])
     assert parsed.json_payload == json_payload
+
+
+def test_parse_summary_arguments():
+    manager = ArgsParseManager()
+    json_payload = (
+        '{"keywords": ["python"], "proxies": ["1.1.1.1:8080"], "type": "Repositories"}'
+    )
+    parsed = manager.parse_args(
+        ["-json_payload", json_payload, "-summary", "-top_k", "3"]
+    )
+    assert parsed.summary is True
+    assert parsed.top_k == 3
+
+    parsed = manager.parse_args(["-json_payload", json_payload])
+    assert parsed.summary is False
+    assert parsed.top_k == 5
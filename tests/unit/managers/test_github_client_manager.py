@@ -1,11 +1,18 @@
+import asyncio
 from unittest.mock import AsyncMock, call
 from itertools import cycle
 
+import httpx
 import pytest
+from pydantic import ValidationError
 
-from src.managers.github_client_manager import GithubClientManager, InvalidHtmlError
-from src.client import GithubClient
-from src.models import SearchRequestParams
+from src.managers.github_client_manager import (
+    GithubClientManager,
+    InvalidHtmlError,
+    NoAliveProxiesError,
+)
+from src.client import GithubClient, ProxyWarmupResult
+from src.models import SearchRequestParams, SearchResult, DetailedRepoInfo
 from src.enums import SearchType
 
 
@@ -326,3 +333,125 @@ async def test_wikis_search_response_success(
         call(query="python", search_type=SearchType.WIKIS, proxy="1.1.1.1"),
         call(query="django", search_type=SearchType.WIKIS, proxy="1.1.1.1"),
     ]
+
+
+@pytest.mark.asyncio
+async def test_search_response_skips_dead_proxies_after_warm_up(
+    github_client_manager: GithubClientManager,
+    get_issues_search_response,
+):
+    payload = SearchRequestParams(
+        keywords=["python"],
+        proxies=["1.1.1.1", "2.2.2.2"],
+        type=SearchType.ISSUES,
+        warmup_connections=2,
+    )
+    github_client_manager.github_client.warm_up = AsyncMock(
+        return_value={
+            "1.1.1.1": ProxyWarmupResult("1.1.1.1", errors=["ConnectError: refused"]),
+            "2.2.2.2": ProxyWarmupResult("2.2.2.2", opened_connections=2),
+        }
+    )
+    github_client_manager.github_client.get_search_results_page = AsyncMock(
+        side_effect=[get_issues_search_response("python")]
+    )
+    response = await github_client_manager.get_search_results_response(payload.json())
+
+    assert len(response) == 10
+    github_client_manager.github_client.warm_up.assert_called_once_with(
+        ["1.1.1.1", "2.2.2.2"], 2
+    )
+    github_client_manager.github_client.get_search_results_page.assert_called_once_with(
+        query="python", search_type=SearchType.ISSUES, proxy="2.2.2.2"
+    )
+
+
+@pytest.mark.asyncio
+async def test_search_response_raise_exc_if_all_proxies_dead(
+    github_client_manager: GithubClientManager,
+):
+    payload = SearchRequestParams(
+        keywords=["python"],
+        proxies=["1.1.1.1"],
+        type=SearchType.ISSUES,
+        warmup_connections=1,
+    )
+    github_client_manager.github_client.warm_up = AsyncMock(
+        return_value={"1.1.1.1": ProxyWarmupResult("1.1.1.1")}
+    )
+    with pytest.raises(NoAliveProxiesError):
+        await github_client_manager.get_search_results_response(payload.json())
+
+    github_client_manager.github_client.get_search_results_page.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_manager_closes_only_own_client(github_client_mocked):
+    async with GithubClientManager(github_client=github_client_mocked):
+        pass
+    github_client_mocked.aclose.assert_not_called()
+
+    async with GithubClientManager() as manager:
+        manager.github_client.aclose = AsyncMock()
+    manager.github_client.aclose.assert_called_once_with()
+
+
+@pytest.mark.asyncio
+async def test_repositories_search_cancels_pending_requests_on_failure(
+    github_client_manager: GithubClientManager,
+    get_repositories_search_response,
+):
+    payload = SearchRequestParams(
+        keywords=["python"], proxies=["1.1.1.1"], type=SearchType.REPOSITORIES
+    )
+    cancelled = []
+
+    async def get_detailed_repository_info_page(repo_url: str, proxy: str):
+        if repo_url.endswith("/kubernetes-client/python"):
+            raise httpx.HTTPError("Server error")
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(repo_url)
+            raise
+
+    github_client_manager.github_client.get_search_results_page = AsyncMock(
+        side_effect=[get_repositories_search_response("python")]
+    )
+    github_client_manager.github_client.get_detailed_repository_info_page = (
+        get_detailed_repository_info_page
+    )
+    with pytest.raises(httpx.HTTPError):
+        await github_client_manager.get_search_results_response(payload.json())
+
+    assert len(cancelled) == 9
+
+
+@pytest.mark.asyncio
+async def test_search_response_validates_results_on_request(
+    github_client_manager: GithubClientManager,
+):
+    payload = SearchRequestParams(
+        keywords=["python"], proxies=["1.1.1.1"], type=SearchType.REPOSITORIES
+    )
+    results = [
+        SearchResult(url="https://github.com/django/django/issues/1"),
+        SearchResult(
+            url="https://github.com/django/django",
+            extra=DetailedRepoInfo("django", {"Python": 97.2}),
+        ),
+    ]
+    github_client_manager.get_search_results = AsyncMock(return_value=results)
+
+    response = await github_client_manager.get_search_results_response(
+        payload.json(), validate=True
+    )
+    assert response == [result.to_dict() for result in results]
+
+    github_client_manager.get_search_results = AsyncMock(
+        return_value=[results[1]._replace(extra=DetailedRepoInfo("django", None))]
+    )
+    with pytest.raises(ValidationError):
+        await github_client_manager.get_search_results_response(
+            payload.json(), validate=True
+        )
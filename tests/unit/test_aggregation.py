@@ -0,0 +1,130 @@
+import numpy as np
+import pytest
+
+from src.aggregation import LanguageStatsTable
+from src.models import SearchResult, DetailedRepoInfo
+
+
+@pytest.fixture()
+def search_results():
+    return [
+        SearchResult(
+            url="https://github.com/django/django",
+            extra=DetailedRepoInfo("django", {"Python": 90.0, "HTML": 10.0}),
+            keyword="django",
+        ),
+        SearchResult(
+            url="https://github.com/django/channels",
+            extra=DetailedRepoInfo("django", {"Python": 100.0}),
+            keyword="django",
+        ),
+        SearchResult(
+            url="https://github.com/vinta/awesome-python",
+            extra=DetailedRepoInfo("vinta", {"HTML": 40.0, "Ruby": 60.0}),
+            keyword="python",
+        ),
+        SearchResult(url="https://github.com/vinta/awesome-python/issues/1"),
+    ]
+
+
+def test_table_from_results(search_results):
+    table = LanguageStatsTable.from_results(search_results)
+
+    assert len(table) == 3
+    assert table.matrix.dtype == np.float32
+    assert table.languages == ["Python", "HTML", "Ruby"]
+    assert table.owners == ["django", "vinta"]
+    assert table.keywords == ["django", "python"]
+    np.testing.assert_array_equal(
+        table.matrix,
+        [[90.0, 10.0, 0.0], [100.0, 0.0, 0.0], [0.0, 40.0, 60.0]],
+    )
+    np.testing.assert_array_equal(table.owner_codes, [0, 0, 1])
+    np.testing.assert_array_equal(table.keyword_rows, [0, 1, 2])
+    np.testing.assert_array_equal(table.keyword_codes, [0, 0, 1])
+
+
+def test_table_shares(search_results):
+    table = LanguageStatsTable.from_results(search_results)
+
+    np.testing.assert_allclose(table.weighted_totals(), [190.0, 50.0, 60.0])
+    np.testing.assert_allclose(
+        table.weighted_totals(weights=[1.0, 0.0, 2.0]), [90.0, 90.0, 120.0]
+    )
+    np.testing.assert_allclose(table.shares(), [190 / 3, 50 / 3, 20.0])
+    np.testing.assert_allclose(
+        table.keyword_shares(), [[95.0, 5.0, 0.0], [0.0, 40.0, 60.0]]
+    )
+    np.testing.assert_allclose(table.owner_shares(), table.keyword_shares())
+
+
+def test_table_summary(search_results):
+    summary = LanguageStatsTable.from_results(search_results).summary(top_k=2)
+
+    assert summary == {
+        "repositories": 3,
+        "languages": 3,
+        "totals": {"Python": 190.0, "HTML": 50.0, "Ruby": 60.0},
+        "top_languages": {"Python": 63.33, "Ruby": 20.0},
+        "by_keyword": {
+            "django": {"Python": 95.0, "HTML": 5.0},
+            "python": {"Ruby": 60.0, "HTML": 40.0},
+        },
+        "by_owner": {
+            "django": {"Python": 95.0, "HTML": 5.0},
+            "vinta": {"Ruby": 60.0, "HTML": 40.0},
+        },
+    }
+
+
+def test_table_summary_without_repositories():
+    summary = LanguageStatsTable.from_results(
+        [SearchResult(url="https://github.com/django/django/issues/1")]
+    ).summary()
+    assert summary == {
+        "repositories": 0,
+        "languages": 0,
+        "totals": {},
+        "top_languages": {},
+        "by_keyword": {},
+        "by_owner": {},
+    }
+
+
+def test_table_counts_repo_found_by_several_keywords_once(search_results):
+    duplicated = search_results[0]._replace(keyword="python")
+    table = LanguageStatsTable.from_results(
+        search_results + [duplicated, search_results[0]]
+    )
+
+    assert len(table) == 3
+    assert table.urls == [result.url for result in search_results[:3]]
+    np.testing.assert_array_equal(table.keyword_rows, [0, 1, 2, 0])
+    np.testing.assert_array_equal(table.keyword_codes, [0, 0, 1, 1])
+    np.testing.assert_allclose(table.weighted_totals(), [190.0, 50.0, 60.0])
+    np.testing.assert_allclose(table.owner_shares()[0], [95.0, 5.0, 0.0])
+    np.testing.assert_allclose(
+        table.keyword_shares(), [[95.0, 5.0, 0.0], [45.0, 25.0, 30.0]]
+    )
+
+
+def test_table_top_k_skips_unused_languages(search_results):
+    owner_without_stats = SearchResult(
+        url="https://github.com/empty/empty",
+        extra=DetailedRepoInfo("empty", {}),
+        keyword="django",
+    )
+    summary = LanguageStatsTable.from_results(
+        search_results + [owner_without_stats]
+    ).summary(top_k=5)
+
+    assert summary["top_languages"] == {"Python": 63.33, "Ruby": 20.0, "HTML": 16.67}
+    assert summary["by_keyword"] == {
+        "django": {"Python": 95.0, "HTML": 5.0},
+        "python": {"Ruby": 60.0, "HTML": 40.0},
+    }
+    assert summary["by_owner"] == {
+        "django": {"Python": 95.0, "HTML": 5.0},
+        "vinta": {"Ruby": 60.0, "HTML": 40.0},
+        "empty": {},
+    }
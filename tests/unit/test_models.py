@@ -1,7 +1,15 @@
+import json
+
 import pytest
 from pydantic import ValidationError
 
-from src.models import SearchRequestParams
+from src.models import (
+    SearchRequestParams,
+    SearchResult,
+    SearchResultResponse,
+    DetailedRepoInfo,
+    dump_search_results_json,
+)
 
 
 @pytest.mark.parametrize(
@@ -31,3 +39,41 @@ def test_search_request_params_success(json_payload: str):
 def test_search_request_raise_exc_if_invalid_payload(json_payload: str):
     with pytest.raises(ValidationError):
         SearchRequestParams.model_validate_json(json_payload)
+
+
+@pytest.mark.parametrize(
+    "search_result",
+    [
+        SearchResult(url="https://github.com/mouredev/Hello-Python/issues/61"),
+        SearchResult(
+            url="https://github.com/django/django",
+            extra=DetailedRepoInfo(
+                owner="django",
+                language_stats={"Python": 97.2, "HTML": 1.4, "Smarty": 0.0},
+            ),
+        ),
+        SearchResult(
+            url='https://github.com/"quoted"/r\u00e9po',
+            extra=DetailedRepoInfo(owner="\u00e9", language_stats={}),
+        ),
+    ],
+)
+def test_search_result_serialization(search_result: SearchResult):
+    expected_dict = SearchResultResponse.model_validate(
+        search_result.to_dict()
+    ).model_dump(exclude_unset=True)
+    assert search_result.to_dict() == expected_dict
+
+
+def test_dump_search_results_json():
+    search_results = [
+        SearchResult(url="https://github.com/django/django"),
+        SearchResult(
+            url="https://github.com/encode/django-rest-framework",
+            extra=DetailedRepoInfo(owner="encode", language_stats={"Python": 99.5}),
+        ),
+    ]
+    assert dump_search_results_json(search_results) == json.dumps(
+        [search_result.to_dict() for search_result in search_results]
+    )
+    assert dump_search_results_json([]) == "[]"
@@ -0,0 +1,32 @@
+import pytest
+from lxml import etree
+
+from src.parsing import parse_html, extract_result_paths, extract_language_stats
+
+
+def test_extract_result_paths(get_repositories_search_response):
+    tree = parse_html(get_repositories_search_response("django"))
+    paths = extract_result_paths(tree)
+    assert len(paths) == 10
+    assert paths[0] == "/django/django"
+
+
+def test_extract_language_stats(get_repo_detailed_info_response):
+    tree = parse_html(get_repo_detailed_info_response(2))
+    assert extract_language_stats(tree) == {
+        "HTML": 48.6,
+        "Just": 41.7,
+        "Ruby": 7.6,
+        "SCSS": 2.1,
+    }
+
+
+def test_parse_html_drops_comments():
+    tree = parse_html("<body><!-- note --><p>1</p></body>")
+    assert not tree.xpath("//comment()")
+
+
+@pytest.mark.parametrize("input_html", ["", "   "])
+def test_parse_html_raise_exc_if_empty(input_html: str):
+    with pytest.raises(etree.ParserError):
+        parse_html(input_html)
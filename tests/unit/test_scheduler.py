@@ -0,0 +1,136 @@
+import asyncio
+
+import pytest
+
+from src.enums import RequestPriority
+from src.scheduler import (
+    RequestScheduler,
+    request_flow,
+    get_current_flow,
+    get_request_priority,
+)
+
+
+async def _run_queued(scheduler: RequestScheduler, requests):
+    order = []
+    gate = asyncio.Event()
+
+    async def blocker():
+        async with scheduler.slot(RequestPriority.BATCH_DETAIL):
+            await gate.wait()
+
+    async def worker(name, priority, flow):
+        async with scheduler.slot(priority, flow=flow):
+            order.append(name)
+
+    blocker_task = asyncio.create_task(blocker())
+    await asyncio.sleep(0)
+    tasks = [asyncio.create_task(worker(*request)) for request in requests]
+    await asyncio.sleep(0)
+    gate.set()
+    await asyncio.gather(blocker_task, *tasks)
+    return order
+
+
+@pytest.mark.asyncio
+async def test_scheduler_serves_higher_priority_first():
+    scheduler = RequestScheduler(concurrency=1)
+    order = await _run_queued(
+        scheduler,
+        [
+            ("batch_detail", RequestPriority.BATCH_DETAIL, "a"),
+            ("interactive_detail", RequestPriority.INTERACTIVE_DETAIL, "a"),
+            ("batch_search", RequestPriority.BATCH_SEARCH, "a"),
+            ("interactive_search", RequestPriority.INTERACTIVE_SEARCH, "a"),
+        ],
+    )
+    assert order == [
+        "interactive_search",
+        "interactive_detail",
+        "batch_search",
+        "batch_detail",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_scheduler_round_robins_flows_within_priority():
+    scheduler = RequestScheduler(concurrency=1)
+    priority = RequestPriority.INTERACTIVE_DETAIL
+    order = await _run_queued(
+        scheduler,
+        [
+            ("a1", priority, "a"),
+            ("a2", priority, "a"),
+            ("a3", priority, "a"),
+            ("b1", priority, "b"),
+            ("b2", priority, "b"),
+        ],
+    )
+    assert order == ["a1", "b1", "a2", "b2", "a3"]
+
+
+@pytest.mark.asyncio
+async def test_scheduler_collects_stats():
+    scheduler = RequestScheduler(concurrency=1)
+    priority = RequestPriority.INTERACTIVE_SEARCH
+    await _run_queued(scheduler, [("a", priority, "a"), ("b", priority, "b")])
+
+    stats = scheduler.stats()[priority]
+    assert stats.dispatched == 2
+    assert stats.queue_depth == 0
+    assert stats.max_queue_depth == 2
+    assert stats.max_wait_time >= stats.avg_wait_time > 0
+    assert scheduler.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_scheduler_drops_cancelled_waiters():
+    scheduler = RequestScheduler(concurrency=1)
+    await scheduler.acquire(RequestPriority.INTERACTIVE_SEARCH)
+    waiter = asyncio.create_task(scheduler.acquire(RequestPriority.BATCH_SEARCH))
+    await asyncio.sleep(0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    scheduler.release()
+    assert scheduler.in_flight == 0
+    assert scheduler.stats()[RequestPriority.BATCH_SEARCH].queue_depth == 0
+
+
+@pytest.mark.parametrize(
+    "batch, is_search, expected_priority, expected_default_priority",
+    [
+        (
+            False,
+            True,
+            RequestPriority.INTERACTIVE_SEARCH,
+            RequestPriority.INTERACTIVE_SEARCH,
+        ),
+        (
+            False,
+            False,
+            RequestPriority.INTERACTIVE_DETAIL,
+            RequestPriority.INTERACTIVE_DETAIL,
+        ),
+        (True, True, RequestPriority.BATCH_SEARCH, RequestPriority.INTERACTIVE_SEARCH),
+        (
+            True,
+            False,
+            RequestPriority.BATCH_DETAIL,
+            RequestPriority.INTERACTIVE_DETAIL,
+        ),
+    ],
+)
+def test_request_priority_follows_flow(
+    batch: bool,
+    is_search: bool,
+    expected_priority: RequestPriority,
+    expected_default_priority: RequestPriority,
+):
+    with request_flow(flow="payload", batch=batch):
+        assert get_request_priority(is_search=is_search) == expected_priority
+        assert get_current_flow() == "payload"
+
+    assert get_request_priority(is_search=is_search) == expected_default_priority
+    assert get_current_flow() is None
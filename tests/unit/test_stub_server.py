@@ -0,0 +1,170 @@
+import asyncio
+
+import httpx
+import pytest
+
+from src.enums import SearchType
+from src.managers import GithubClientManager
+from src.models import SearchRequestParams
+from tests.load_report import LevelReport
+from tests.stub_server import (
+    GithubStubServer,
+    LatencyDistribution,
+    StubGithubClient,
+    StubServerConfig,
+)
+
+
+@pytest.mark.asyncio
+async def test_stub_server_serves_search_and_repo_pages():
+    async with GithubStubServer() as server, StubGithubClient(server.url) as client:
+        manager = GithubClientManager(github_client=client)
+        payload = SearchRequestParams(
+            keywords=["python", "django"],
+            proxies=[server.address],
+            type=SearchType.REPOSITORIES,
+        )
+        response = await manager.get_search_results_response(payload.json())
+
+    assert len(response) == 20
+    assert response[0]["url"] == "https://github.com/kubernetes-client/python"
+    assert response[0]["extra"]["owner"] == "kubernetes-client"
+    assert server.stats["requests"] == 22
+    assert server.stats[200] == 22
+
+
+@pytest.mark.asyncio
+async def test_stub_server_supports_proxy_warm_up():
+    async with GithubStubServer() as server, StubGithubClient(server.url) as client:
+        manager = GithubClientManager(github_client=client)
+        payload = SearchRequestParams(
+            keywords=["python"],
+            proxies=[server.address],
+            type=SearchType.ISSUES,
+            warmup_connections=2,
+        )
+        response = await manager.get_search_results_response(payload.json())
+
+    assert len(response) == 10
+    # two warm-up HEADs, then the search reuses one of the warmed connections
+    assert server.stats["requests"] == 3
+    assert server.stats["connections"] == 2
+
+
+@pytest.mark.asyncio
+async def test_stub_server_answers_head_without_body():
+    async with GithubStubServer() as server:
+        async with httpx.AsyncClient() as client:
+            head_response = await client.head(f"{server.url}/django/django")
+            get_response = await client.get(f"{server.url}/search?q=python")
+
+    assert head_response.status_code == 200
+    assert int(head_response.headers["Content-Length"]) > 0
+    assert head_response.content == b""
+    assert get_response.status_code == 200
+    assert "results-list" in get_response.text
+
+
+@pytest.mark.asyncio
+async def test_stub_server_injects_rate_limit_with_retry_after():
+    config = StubServerConfig(rate_429=1.0, retry_after=7)
+    async with GithubStubServer(config) as server:
+        async with httpx.AsyncClient() as client:
+            response = await client.get(f"{server.url}/search?q=python")
+
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "7"
+
+
+@pytest.mark.asyncio
+async def test_stub_server_resets_connection():
+    async with GithubStubServer(StubServerConfig(reset_rate=1.0)) as server:
+        async with httpx.AsyncClient() as client:
+            with pytest.raises(httpx.TransportError):
+                await client.get(f"{server.url}/django/django")
+
+    assert server.stats["resets"] == 1
+
+
+@pytest.mark.asyncio
+async def test_stub_server_stop_cancels_open_connections():
+    server = GithubStubServer()
+    await server.start()
+    reader, writer = await asyncio.open_connection(server.host, server.port)
+    writer.write(b"GET /search?q=python HTTP/1.1\r\nhost: github.com\r\n\r\n")
+    await reader.readuntil(b"\r\n\r\n")
+    # the connection stays keep-alive and its handler waits for the next request
+    await asyncio.sleep(0.01)
+    assert server._handler_tasks
+
+    await server.stop()
+    assert not server._handler_tasks
+    writer.close()
+
+
+@pytest.mark.asyncio
+async def test_stub_server_stop_does_not_report_cancelled_handlers():
+    loop = asyncio.get_running_loop()
+    reported = []
+    loop.set_exception_handler(lambda loop, context: reported.append(context))
+    try:
+        config = StubServerConfig(drip_rate=1.0, drip_chunk_size=16, drip_delay=0.05)
+        server = GithubStubServer(config)
+        await server.start()
+        connections = []
+        for path in (b"/search?q=python", b"/django/django"):
+            reader, writer = await asyncio.open_connection(server.host, server.port)
+            writer.write(b"GET " + path + b" HTTP/1.1\r\nhost: github.com\r\n\r\n")
+            await reader.readuntil(b"\r\n\r\n")
+            connections.append(writer)
+
+        # one handler is mid-drip, the other waits on a keep-alive connection
+        await server.stop()
+        await asyncio.sleep(0.01)
+        for writer in connections:
+            writer.close()
+    finally:
+        loop.set_exception_handler(None)
+
+    assert reported == []
+
+
+@pytest.mark.asyncio
+async def test_stub_server_survives_client_disconnect_mid_drip():
+    config = StubServerConfig(drip_rate=1.0, drip_chunk_size=16, drip_delay=0.01)
+    async with GithubStubServer(config) as server:
+        reader, writer = await asyncio.open_connection(server.host, server.port)
+        writer.write(b"GET /django/django HTTP/1.1\r\nhost: github.com\r\n\r\n")
+        await reader.readuntil(b"\r\n\r\n")
+        writer.transport.abort()
+        await asyncio.sleep(0.05)
+        assert not server._handler_tasks
+
+    assert server.stats["drips"] == 1
+
+
+@pytest.mark.parametrize(
+    "percent, expected",
+    [(50, 5), (90, 9), (95, 10), (99, 10), (100, 10), (1, 1)],
+)
+def test_level_report_percentile_nearest_rank(percent: float, expected: float):
+    report = LevelReport(concurrency=1, latencies=[float(n) for n in range(10, 0, -1)])
+    assert report.percentile(percent) == expected
+
+
+@pytest.mark.parametrize(
+    "spec, expected",
+    [
+        ("constant:0.5", LatencyDistribution("constant", (0.5,))),
+        ("uniform:0.1,0.2", LatencyDistribution("uniform", (0.1, 0.2))),
+        ("lognormal:0.05,0.5", LatencyDistribution("lognormal", (0.05, 0.5))),
+    ],
+)
+def test_latency_distribution_parse(spec: str, expected: LatencyDistribution):
+    assert LatencyDistribution.parse(spec) == expected
+
+
+@pytest.mark.parametrize("spec", ["normal:1", "uniform:0.1", "constant"])
+def test_latency_distribution_parse_invalid(spec: str):
+    with pytest.raises(ValueError):
+        LatencyDistribution.parse(spec)